@@ -77,6 +77,19 @@ class Config:
     HOURS_RANGE = (70, 80)
     OVERTIME_MULTIPLIER = 1.5
     
+    RANDOM_SEED = None  # Seed for reproducible data; None seeds from OS entropy
+    
+    # Faker settings
+    FAKER_POOL_SIZE = 64  # Values generated per batch for pooled Faker fields
+    FAKER_PROVIDERS = None  # Tuple of provider modules overriding each generator's own
+    
+    # Template settings
+    TEMPLATE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".jinja_cache")
+    
+    # Batch generation settings
+    BATCH_CHUNK_SIZE = 16  # Documents handed to a worker process at a time
+    IO_THREADS = 2  # Image encode/write threads per worker process
+    
     # Output settings
     DEFAULT_OUTPUT_DIR = "./dataset"
     DEFAULT_COUNTS = {
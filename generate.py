@@ -20,6 +20,9 @@ except ImportError:
 
 from config import Config
 
+# Progress lines are written directly rather than through print()
+_write = sys.stdout.write
+
 
 def setup_output_directories(base_path: str):
     """Create output directory structure."""
@@ -35,41 +38,44 @@ def setup_output_directories(base_path: str):
     print(f"Created output directories in: {base_path}")
 
 
-def generate_documents(doc_type: str, count: int, output_dir: str, config: Config):
-    """Generate documents of specified type using the new class hierarchy."""
+def generate_documents(doc_type: str, count: int, output_dir: str, config: Config, workers: int = None) -> int:
+    """Generate documents of specified type in parallel worker processes.
     
-    # Create the appropriate generator
-    if doc_type == "w2":
-        generator = W2Generator(config)
-    elif doc_type == "paystub":
-        generator = PaystubGenerator(config)
-    elif doc_type == "other":
-        generator = OtherGenerator(config)
-    else:
+    Returns the number of documents that failed to generate.
+    """
+    
+    # Pick the appropriate generator; each worker process builds its own
+    generator_classes = {
+        "w2": W2Generator,
+        "paystub": PaystubGenerator,
+        "other": OtherGenerator,
+    }
+    if doc_type not in generator_classes:
         print(f"Unknown document type: {doc_type}")
-        return
+        return count
     
     print(f"Generating {count} {doc_type} documents...")
     
-    for i in range(count):
-        try:
-            # Generate filename
-            filename = "synthetic_" + doc_type + "_" + str(i+1).zfill(4) + ".jpg"
-            output_path = os.path.join(output_dir, doc_type, filename)
-            
-            # Generate and save document
-            generator.generate_and_save(output_path)
-            
-            if (i + 1) % 10 == 0:
-                print("Generated " + str(i + 1) + "/" + str(count) + " " + doc_type + " documents")
-                
-        except Exception as e:
-            print("Error generating " + doc_type + " document " + str(i+1) + ": " + str(e))
-            import traceback
-            traceback.print_exc()
-            continue
+    # Failed documents are reported by the worker and yield None
+    results = generator_classes[doc_type].iter_batch(
+        count, os.path.join(output_dir, doc_type), config,
+        max_workers=workers, prefix=f"synthetic_{doc_type}"
+    )
+    failed = 0
+    for i, filepath in enumerate(results, 1):
+        if filepath is None:
+            failed += 1
+        if i % 10 == 0:
+            _write(f"Generated {i - failed}/{count} {doc_type} documents\n")
+            if i % 100 == 0:
+                sys.stdout.flush()
+    sys.stdout.flush()
     
-    print(f"Completed generating {doc_type} documents")
+    if failed:
+        print(f"Completed generating {doc_type} documents: {failed}/{count} failed")
+    else:
+        print(f"Completed generating {doc_type} documents")
+    return failed
 
 
 def main():
@@ -84,6 +90,8 @@ def main():
                        help="Number of other documents to generate")
     parser.add_argument("--doc_type", choices=["w2", "paystub", "other", "all"],
                        default="all", help="Type of documents to generate")
+    parser.add_argument("--workers", type=int, default=None,
+                       help="Number of worker processes (default: one per CPU core)")
     
     args = parser.parse_args()
     
@@ -97,19 +105,24 @@ def main():
     
     # Generate documents based on arguments
     if args.doc_type == "all":
-        generate_documents("w2", args.w2_count, args.output_dir, config)
-        generate_documents("paystub", args.paystub_count, args.output_dir, config)
-        generate_documents("other", args.other_count, args.output_dir, config)
+        failed = generate_documents("w2", args.w2_count, args.output_dir, config, args.workers)
+        failed += generate_documents("paystub", args.paystub_count, args.output_dir, config, args.workers)
+        failed += generate_documents("other", args.other_count, args.output_dir, config, args.workers)
     else:
         count_map = {
             "w2": args.w2_count,
             "paystub": args.paystub_count,
             "other": args.other_count
         }
-        generate_documents(args.doc_type, count_map[args.doc_type], args.output_dir, config)
+        failed = generate_documents(args.doc_type, count_map[args.doc_type], args.output_dir, config, args.workers)
     
-    print("\nGeneration complete!")
+    if failed:
+        print(f"\nGeneration finished with {failed} failed documents, see the errors above")
+    else:
+        print("\nGeneration complete!")
     print(f"Generated documents saved to: {args.output_dir}")
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -2,9 +2,27 @@
 Document generators package
 """
 
-from .base_generator import BaseDocumentGenerator
-from .w2.generator import W2Generator
-from .paystub.generator import PaystubGenerator
-from .other.generator import OtherGenerator
+import importlib
 
-__all__ = ['BaseDocumentGenerator', 'W2Generator', 'PaystubGenerator', 'OtherGenerator']
\ No newline at end of file
+# Exported names and the submodules defining them. Submodules are imported on
+# first attribute access so using one generator does not load the others.
+_EXPORTS = {
+    'BaseDocumentGenerator': '.base_generator',
+    'W2Generator': '.w2.generator',
+    'PaystubGenerator': '.paystub.generator',
+    'OtherGenerator': '.other.generator',
+}
+
+__all__ = ['BaseDocumentGenerator', 'W2Generator', 'PaystubGenerator', 'OtherGenerator']
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
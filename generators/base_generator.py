@@ -5,7 +5,10 @@ Base document generator class that handles fake data population and augmentation
 import numpy as np
 import cv2
 import os
+import sys
+import math
 from faker import Faker
+from faker.providers import BaseProvider
 from augraphy import (
     AugraphyPipeline,
     InkBleed, ColorPaper, Folding, NoiseTexturize, 
@@ -13,25 +16,328 @@ from augraphy import (
     Geometric, Jpeg, default_augraphy_pipeline
 )
 import random
-from datetime import datetime, timedelta
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from datetime import date, timedelta
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import traceback
+from collections import OrderedDict
+from functools import lru_cache
 from config import Config
 from abc import ABC, abstractmethod
-import tempfile
 import weasyprint
-from jinja2 import Template
+from weasyprint.text.fonts import FontConfiguration
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 import fitz  # PyMuPDF
 
 
+# Templates live below the generators package, so a single loader rooted here
+# serves every document type. Templates never change during a run, so skip the
+# per-render stat() (auto_reload) and keep every compiled template (cache_size).
+# Compiled bytecode is also persisted on disk so new processes skip parsing.
+_TEMPLATE_ROOT = os.path.dirname(os.path.abspath(__file__))
+_TEMPLATE_ENV = None
+
+
+def _get_template_env():
+    """Return the shared template Environment, creating it on first use."""
+    global _TEMPLATE_ENV
+    if _TEMPLATE_ENV is None:
+        # Create the bytecode cache directory only once templates are needed,
+        # and compile without it where it cannot be written (read-only installs)
+        try:
+            os.makedirs(Config.TEMPLATE_CACHE_DIR, exist_ok=True)
+            cache_writable = os.access(Config.TEMPLATE_CACHE_DIR, os.W_OK)
+        except OSError:
+            cache_writable = False
+        _TEMPLATE_ENV = Environment(
+            loader=FileSystemLoader(_TEMPLATE_ROOT),
+            auto_reload=False,
+            cache_size=-1,
+            bytecode_cache=FileSystemBytecodeCache(Config.TEMPLATE_CACHE_DIR) if cache_writable else None
+        )
+        # Amounts are passed to templates as floats and formatted only where rendered
+        _TEMPLATE_ENV.filters['money'] = lambda value: f"{value:.2f}"
+    return _TEMPLATE_ENV
+
+
+def get_template(template_path):
+    """Return the compiled Jinja2 template for a template file path."""
+    path = os.path.abspath(template_path)
+    if not path.startswith(_TEMPLATE_ROOT + os.sep):
+        # The loader only sees the generators package, so templates kept
+        # anywhere else are compiled from their source instead
+        return _get_external_template(path)
+    name = os.path.relpath(path, _TEMPLATE_ROOT)
+    return _get_template_env().get_template(name.replace(os.sep, '/'))
+
+
+@lru_cache(maxsize=None)
+def _get_external_template(path):
+    """Compile a template file outside the generators package once per process."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return _get_template_env().from_string(f.read())
+
+
+@lru_cache(maxsize=None)
+def discover_templates(templates_dir):
+    """Return the sorted HTML template paths in a directory, scanning it once per process."""
+    with os.scandir(templates_dir) as entries:
+        template_files = tuple(sorted(  # Sort for consistent ordering
+            entry.path for entry in entries
+            if entry.name.endswith('.html') and entry.is_file()
+        ))
+    if not template_files:
+        raise FileNotFoundError(f"No HTML templates found in {templates_dir}")
+    return template_files
+
+
+def format_mmdd(d):
+    """Format a date as MM/DD without going through strftime."""
+    return f"{d.month:02d}/{d.day:02d}"
+
+
+def format_mmddyyyy(d):
+    """Format a date as MM/DD/YYYY without going through strftime."""
+    return f"{d.month:02d}/{d.day:02d}/{d.year}"
+
+
+@lru_cache(maxsize=None)
+def _render_matrix(page_width, page_height, width, height):
+    """Return the matrix scaling a page of the given size to width x height pixels."""
+    return fitz.Matrix(width / page_width, height / page_height)
+
+
+# Newline to HTML line break table for str.translate, see HtmlAddressProvider
+_NL_TO_BR = str.maketrans({'\n': '<br>'})
+
+
+class HtmlAddressProvider(BaseProvider):
+    """Faker provider for addresses with HTML line breaks instead of newlines."""
+    
+    _html_formats = None
+    
+    def html_address(self):
+        """Return an address like Faker's address(), with <br> between its lines."""
+        address_provider = self.generator.provider('faker.providers.address')
+        if self._html_formats is None:
+            # Convert the locale's address formats once; the line breaks are
+            # then emitted by parse() instead of replaced afterwards
+            formats = address_provider.address_formats
+            if isinstance(formats, dict):
+                # random_element only accepts weighted choices as an OrderedDict
+                self._html_formats = OrderedDict(
+                    (fmt.translate(_NL_TO_BR), weight) for fmt, weight in formats.items()
+                )
+            else:
+                self._html_formats = tuple(fmt.translate(_NL_TO_BR) for fmt in formats)
+        # Pick through the address provider so its weighting setting applies
+        return self.generator.parse(address_provider.random_element(self._html_formats))
+
+
+# Start batch workers by forking where that is safe, so they inherit the
+# parent's already-built Faker instances (see iter_batch) instead of each
+# loading the providers again; macOS system frameworks are not fork-safe
+_BATCH_MP_CONTEXT = (
+    multiprocessing.get_context('fork')
+    if 'fork' in multiprocessing.get_all_start_methods() and sys.platform != 'darwin'
+    else None
+)
+
+
+# Generator instance owned by a batch worker process, see generate_batch(),
+# and the threads encoding and writing its images with the slots bounding how
+# many rendered images may wait for them
+_worker_generator = None
+_worker_writer = None
+_worker_write_slots = None
+
+
+def _init_batch_worker(generator_cls, config):
+    """Create the worker's generator once so its per-process caches stay warm."""
+    global _worker_generator, _worker_writer, _worker_write_slots
+    # Workers already use every core, so keep OpenCV from oversubscribing them
+    cv2.setNumThreads(1)
+    
+    _worker_generator = generator_cls(config)
+    if config.RANDOM_SEED is None:
+        # Forked workers inherit the parent's RNG states, including the
+        # module-level ones Augraphy and Faker draw from, so reseed them all
+        # from OS entropy; seeded runs reseed per chunk instead
+        random.seed()
+        np.random.seed()
+        _worker_generator.fake.seed_instance()
+    
+    _worker_writer = ThreadPoolExecutor(max_workers=config.IO_THREADS)
+    _worker_write_slots = threading.BoundedSemaphore(2 * config.IO_THREADS)
+
+
+def _report_batch_error(filepath, error):
+    """Print a batch document failure without stopping the rest of the batch."""
+    print(f"Error generating {filepath}: {error}")
+    traceback.print_exception(type(error), error, error.__traceback__)
+
+
+def _save_batch_document(document, filepath):
+    """Save a rendered document on a writer thread, then free its slot."""
+    try:
+        _worker_generator.save_image(document, filepath)
+    finally:
+        _worker_write_slots.release()
+
+
+def _generate_batch_chunk(chunk):
+    """
+    Generate and save a chunk of documents in a batch worker process.
+    
+    ``chunk`` is (chunk_index, start, filepaths), where start is the batch
+    position of the chunk's first document. Chunks go to whichever worker is
+    free, so seeded runs reseed from the chunk index rather than the worker,
+    and templates are picked from the document's batch position.
+    
+    The chunk's fake data is drawn up front as one batch where the generator
+    supports it. Documents are rendered on the worker's main thread while
+    writer threads encode and write the previous ones, so rendering and I/O
+    overlap. Returns each filepath, or None where generating it failed.
+    """
+    chunk_index, start, filepaths = chunk
+    seed = _worker_generator.config.RANDOM_SEED
+    if seed is not None:
+        _worker_generator.reseed(seed + chunk_index)
+    _worker_generator.seek_template(start)
+    
+    try:
+        batch = _worker_generator.generate_fake_data_batch(len(filepaths))
+    except Exception as e:
+        for filepath in filepaths:
+            _report_batch_error(filepath, e)
+        return [None] * len(filepaths)
+    if batch is None:
+        batch = [None] * len(filepaths)
+    
+    writes = []
+    for filepath, data in zip(filepaths, batch):
+        try:
+            document = _worker_generator.generate_document(data)
+        except Exception as e:
+            _report_batch_error(filepath, e)
+            writes.append(None)
+            continue
+        _worker_write_slots.acquire()
+        writes.append(_worker_writer.submit(_save_batch_document, document, filepath))
+    
+    results = []
+    for filepath, write in zip(filepaths, writes):
+        if write is None:
+            results.append(None)
+            continue
+        try:
+            write.result()
+            results.append(filepath)
+        except Exception as e:
+            _report_batch_error(filepath, e)
+            results.append(None)
+    return results
+
+
 class BaseDocumentGenerator(ABC):
     """Base class for all document generators."""
     
+    # Process-wide singletons shared by every generator instance; all are
+    # expensive to build and hold no per-document state.
+    _PIPELINE = None
+    _FONT_CONFIG = None
+    _FAKERS = {}  # Keyed by provider list, see FAKER_PROVIDERS
+    
+    # Faker provider modules this generator uses; None loads every provider.
+    # Subclasses narrow this so Faker skips loading providers they never call.
+    FAKER_PROVIDERS = None
+    
+    # Output directories already created in this process
+    _created_dirs = set()
+    
     def __init__(self, config=None):
-        self.fake = Faker()
         self.config = config or Config()
-        self.pipeline = self._create_augmentation_pipeline()
+        # Per-generator RNGs: no shared module state, and reproducible when seeded
+        seed = self.config.RANDOM_SEED
+        self.random = random.Random(seed)
+        self.rng = np.random.default_rng(seed)
+        if seed is not None:
+            self.fake.seed_instance(seed)
+        self._pools = {}
+        if BaseDocumentGenerator._PIPELINE is None:
+            BaseDocumentGenerator._PIPELINE = self._create_augmentation_pipeline()
+        self.pipeline = BaseDocumentGenerator._PIPELINE
+    
+    def reseed(self, seed):
+        """
+        Reseed every RNG the generator's documents draw from.
+        
+        Covers the generator's own RNGs, its Faker instance and the
+        module-level random and np.random states Augraphy uses. Pooled Faker
+        values drawn before are dropped, so output depends only on the seed.
+        """
+        self.random.seed(seed)
+        self.rng = np.random.default_rng(seed)
+        self.fake.seed_instance(seed)
+        self._pools.clear()
+        random.seed(seed)
+        np.random.seed(seed)
+    
+    @classmethod
+    def _faker_providers(cls, config):
+        """Return the Faker provider modules a generator with this config uses."""
+        return config.FAKER_PROVIDERS or cls.FAKER_PROVIDERS
+    
+    @staticmethod
+    def _get_faker(providers):
+        """Return the Faker instance for a provider list, creating it on first use."""
+        faker = BaseDocumentGenerator._FAKERS.get(providers)
+        if faker is None:
+            faker = Faker(providers=list(providers) if providers else None)
+            if not providers or 'faker.providers.address' in providers:
+                faker.add_provider(HtmlAddressProvider)
+            BaseDocumentGenerator._FAKERS[providers] = faker
+        return faker
+    
+    @property
+    def fake(self):
+        """Faker instance shared by generators with the same providers, created on first use."""
+        return self._get_faker(self._faker_providers(self.config))
+    
+    def _pooled(self, method, *args):
+        """
+        Return the next value of ``self.fake.<method>(*args)`` from a pre-generated pool.
+        
+        Values are generated Config.FAKER_POOL_SIZE at a time with the Faker
+        method bound once, and each value is handed out only once, so pooling
+        amortizes Faker's dispatch without repeating values across documents.
+        """
+        key = (method, args)
+        pool = self._pools.get(key)
+        if not pool:
+            generate = getattr(self.fake, method)
+            pool = self._pools[key] = [generate(*args) for _ in range(self.config.FAKER_POOL_SIZE)]
+        return pool.pop()
+    
+    def _html_address(self):
+        """Return a pooled Faker address with HTML line breaks."""
+        return self._pooled('html_address')
+    
+    def random_date(self, start_days, end_days=0):
+        """Return a random date between start_days and end_days from today, inclusive."""
+        return date.today() + timedelta(days=int(self.rng.integers(start_days, end_days + 1)))
+    
+    def random_id(self, low, high):
+        """Return an ID-style integer in [low, high]; faster than randint, slightly non-uniform."""
+        return low + self.random.getrandbits(32) % (high - low + 1)
+    
+    @classmethod
+    def _get_font_config(cls):
+        """Return the shared WeasyPrint font configuration, creating it on first use."""
+        if BaseDocumentGenerator._FONT_CONFIG is None:
+            BaseDocumentGenerator._FONT_CONFIG = FontConfiguration()
+        return BaseDocumentGenerator._FONT_CONFIG
     
     def _create_augmentation_pipeline(self):
         """Create the document augmentation pipeline using Augraphy."""
@@ -72,73 +378,174 @@ class BaseDocumentGenerator(ABC):
         """Return the path to the HTML template for this document type."""
         pass
     
+    def get_html_template(self):
+        """Return the compiled Jinja2 template for the next document."""
+        return get_template(self.get_html_template_path())
+    
+    def seek_template(self, position):
+        """
+        Make the next document use the template for this batch position.
+        
+        Generators picking templates round-robin override this so a batch
+        worker can start a chunk where a serial run would be.
+        """
+        pass
+    
     @abstractmethod
     def generate_fake_data(self):
         """Generate fake data specific to this document type."""
         pass
     
-    def render_html_to_image(self, template_path, data, width=850, height=1100):
-        """Render HTML template with data to an image."""
-        # Read the HTML template
-        with open(template_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+    def generate_fake_data_batch(self, n):
+        """
+        Generate fake data for the next n documents at once.
         
-        # Render the template with data using Jinja2
-        template = Template(html_content)
-        rendered_html = template.render(**data)
+        Returns a list of n data dicts, or None to generate each document's
+        data as it is rendered. None is the default, which also suits
+        generators whose data depends on the template picked per document.
+        """
+        return None
+    
+    def render_html_to_image(self, template, data, width=850, height=1100):
+        """Render HTML template (a compiled template or a template path) with data to an image."""
+        if isinstance(template, str):
+            template = get_template(template)
         
-        # Use WeasyPrint to convert HTML to PDF, then to image
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as pdf_file:
-            weasyprint.HTML(string=rendered_html).write_pdf(pdf_file.name)
-            pdf_path = pdf_file.name
+        # Passing the dict positionally avoids building a throwaway kwargs copy
+        rendered_html = template.render(data)
         
-        try:
-            # Convert PDF to image using OpenCV (via intermediate conversion)
-            import fitz  # PyMuPDF
-            pdf_doc = fitz.open(pdf_path)
+        # Use WeasyPrint to convert HTML to PDF bytes in memory, then to image
+        pdf_bytes = weasyprint.HTML(string=rendered_html).write_pdf(
+            font_config=self._get_font_config()
+        )
+        
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as pdf_doc:
             page = pdf_doc[0]
             
-            # Render page to image
-            mat = fitz.Matrix(2.0, 2.0)  # High resolution
-            pix = page.get_pixmap(matrix=mat)
-            img_data = pix.tobytes("ppm")
-            
-            # Convert to OpenCV format
-            img_array = np.frombuffer(img_data, dtype=np.uint8)
-            img = cv2.imdecode(img_array, cv2.IMREAD_COLOR)
-            
-            # Resize to target dimensions
+            # Render page straight at the target size as raw RGB samples
+            mat = _render_matrix(page.rect.width, page.rect.height, width, height)
+            pix = page.get_pixmap(matrix=mat, colorspace=fitz.csRGB, alpha=False)
+            img = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
+        
+        # Convert to OpenCV's BGR layout (also yields a writable copy)
+        img = cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
+        
+        # MuPDF rounds the pixmap bounds, so correct any off-by-one size
+        if img.shape[:2] != (height, width):
             img = cv2.resize(img, (width, height))
-            
-            pdf_doc.close()
-            return img
-            
-        finally:
-            # Clean up temporary PDF file
-            os.unlink(pdf_path)
+        
+        return img
     
-    def generate_clean_document(self):
-        """Generate a clean document image."""
-        template_path = self.get_html_template_path()
-        data = self.generate_fake_data()
-        return self.render_html_to_image(template_path, data)
+    def generate_clean_document(self, data=None):
+        """Generate a clean document image, from pre-generated fake data if given."""
+        template = self.get_html_template()
+        if data is None:
+            data = self.generate_fake_data()
+        return self.render_html_to_image(template, data)
     
     def apply_augmentation(self, image):
         """Apply the augmentation pipeline to make the document look realistic."""
+        # Hand Augraphy a contiguous uint8 image so no op starts from a strided
+        # view or an upcast copy; this is a no-op for images from render_html_to_image
+        image = np.ascontiguousarray(image, dtype=np.uint8)
         return self.pipeline(image)
     
-    def generate_document(self):
-        """Generate a complete document with augmentation."""
-        clean_img = self.generate_clean_document()
+    def generate_document(self, data=None):
+        """Generate a complete document with augmentation, see generate_clean_document()."""
+        clean_img = self.generate_clean_document(data)
         return self.apply_augmentation(clean_img)
     
     def save_image(self, image, filepath):
         """Save the image to the specified filepath."""
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        cv2.imwrite(filepath, image)
+        directory = os.path.dirname(filepath)
+        if directory and directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+        
+        # Encode in memory and write the bytes directly rather than via imwrite
+        extension = os.path.splitext(filepath)[1]
+        params = []
+        if extension.lower() in ('.jpg', '.jpeg'):
+            # Optimized Huffman tables make smaller files at no quality cost
+            params = [cv2.IMWRITE_JPEG_QUALITY, self.config.IMAGE_QUALITY, cv2.IMWRITE_JPEG_OPTIMIZE, 1]
+        success, encoded = cv2.imencode(extension, image, params)
+        if not success:
+            raise ValueError(f"Could not encode image for {filepath}")
+        
+        # Unbuffered write straight from the encoded array
+        data = memoryview(encoded).cast('B')
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
     
     def generate_and_save(self, filepath):
         """Generate a document and save it to the specified path."""
         document = self.generate_document()
         self.save_image(document, filepath)
-        return document
\ No newline at end of file
+        return document
+    
+    @classmethod
+    def iter_batch(cls, count, output_dir, config=None, max_workers=None, prefix="synthetic"):
+        """
+        Generate and save ``count`` documents in parallel worker processes.
+        
+        Each worker builds a single generator and reuses it for every document
+        it is handed; filepaths are dispatched in chunks to amortize IPC, each
+        chunk's fake data is drawn as one batch (see generate_fake_data_batch),
+        and within a chunk image writes overlap with rendering the next document.
+        When Config.RANDOM_SEED is set, the i-th chunk is generated from
+        RANDOM_SEED + i on whichever worker runs it, so a seeded batch of the
+        same count and max_workers produces the same data for every file.
+        
+        Args:
+            count: Number of documents to generate
+            output_dir: Directory the images are written to
+            config: Config instance passed to each worker's generator
+            max_workers: Maximum number of worker processes (defaults to one
+                per core); no more are started than there are chunks
+            prefix: Filename prefix, numbered as ``<prefix>_0001.<ext>``
+        
+        Yields:
+            Each document's filepath in order, or None if generating it failed
+        """
+        config = config or Config()
+        filepaths = [
+            os.path.join(output_dir, f"{prefix}_{i + 1:04d}.{config.IMAGE_FORMAT}")
+            for i in range(count)
+        ]
+        # Shrink chunks so small batches still spread over every worker, and
+        # start no more workers than there are chunks; each worker pays for
+        # building a generator, its templates and its pipeline
+        workers = max(1, min(max_workers or os.cpu_count(), count))
+        chunk_size = min(config.BATCH_CHUNK_SIZE, math.ceil(count / workers)) or 1
+        chunks = [
+            (chunk_index, start, filepaths[start:start + chunk_size])
+            for chunk_index, start in enumerate(range(0, count, chunk_size))
+        ]
+        if not chunks:
+            return
+        workers = min(workers, len(chunks))
+        
+        # Build Faker before the workers fork so they share its provider tables
+        cls._get_faker(cls._faker_providers(config))
+        
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=_BATCH_MP_CONTEXT,
+                                 initializer=_init_batch_worker,
+                                 initargs=(cls, config)) as executor:
+            for results in executor.map(_generate_batch_chunk, chunks):
+                yield from results
+    
+    @classmethod
+    def generate_batch(cls, count, output_dir, config=None, max_workers=None, prefix="synthetic"):
+        """
+        Generate and save ``count`` documents in parallel, see iter_batch().
+        
+        Returns:
+            List of filepaths that were generated successfully
+        """
+        results = cls.iter_batch(count, output_dir, config, max_workers, prefix)
+        return [filepath for filepath in results if filepath is not None]
@@ -3,55 +3,199 @@ Other Document Generator - Diverse document types including driver's licenses, r
 """
 
 import os
-import glob
-import random
-from datetime import datetime, timedelta
-import sys
+import re
+import calendar
+import numpy as np
+from datetime import date, timedelta
+from functools import lru_cache
 
-from ..base_generator import BaseDocumentGenerator
+from ..base_generator import BaseDocumentGenerator, get_template, discover_templates, format_mmdd, format_mmddyyyy
+
+
+# HTML templates for this generator's document types
+_TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), 'templates')
+
+# Template filename keywords and the document type each one selects; a filename
+# containing several keywords is classified by the one appearing first in it
+_DOCUMENT_TYPES = {
+    'drivers_license': 'drivers_license',
+    'receipt': 'receipt',
+    'letter': 'letter',
+    'book': 'book_page',
+    'invoice': 'invoice',
+    'medical': 'medical',
+    'bank': 'bank_statement',
+    'report': 'report_card',
+}
+_DOCUMENT_TYPE_RE = re.compile('(' + '|'.join(_DOCUMENT_TYPES) + ')')
+
+# Item names sold by each store type, used to build receipt line items
+_STORE_ITEMS = {
+    'grocery': ('Milk', 'Bread', 'Eggs', 'Bananas', 'Chicken Breast', 'Rice', 'Pasta', 'Cereal', 'Orange Juice'),
+    'electronics': ('USB Cable', 'Phone Case', 'Wireless Mouse', 'Keyboard', 'Headphones', 'Power Bank', 'Screen Protector'),
+    'clothing': ('T-Shirt', 'Jeans', 'Sneakers', 'Jacket', 'Dress', 'Socks', 'Belt', 'Hat'),
+    'hardware': ('Screws', 'Paint', 'Light Bulb', 'Extension Cord', 'Tool Set', 'Garden Hose', 'Door Handle'),
+    'bookstore': ('Novel', 'Magazine', 'Notebook', 'Pen Set', 'Bookmark', 'Calendar', 'Textbook')
+}
+
+# States issuing driver's licenses, with the layout of their license numbers
+# ('A' marks a letter, a digit marks a digit, anything else is kept verbatim)
+_LICENSE_STATES = (
+    {'name': 'California', 'abbr': 'CA', 'format': 'A1234567'},
+    {'name': 'Texas', 'abbr': 'TX', 'format': '12345678'},
+    {'name': 'Florida', 'abbr': 'FL', 'format': 'A123-456-78-901-0'},
+    {'name': 'New York', 'abbr': 'NY', 'format': '123456789'},
+    {'name': 'Pennsylvania', 'abbr': 'PA', 'format': '12 345 678'},
+    {'name': 'Illinois', 'abbr': 'IL', 'format': 'A123-4567-8901'},
+    {'name': 'Ohio', 'abbr': 'OH', 'format': 'AB123456'},
+)
+
+
+def _parse_license_format(license_format):
+    """Split a license number format into its byte template and letter/digit positions."""
+    alpha_idx = [i for i, char in enumerate(license_format) if char.isalpha()]
+    digit_idx = [i for i, char in enumerate(license_format) if char.isdigit()]
+    return np.frombuffer(license_format.encode('ascii'), dtype=np.uint8), alpha_idx, digit_idx
+
+
+# License number layouts parsed once, keyed by state abbreviation
+_LICENSE_LAYOUTS = {state['abbr']: _parse_license_format(state['format']) for state in _LICENSE_STATES}
+
+# Services billed on invoices
+_INVOICE_SERVICES = ('Web Development', 'Graphic Design', 'Consulting', 'Content Writing', 'Marketing', 'Photography')
+
+# Driver's license field choices
+_EYE_COLORS = ('BRN', 'BLU', 'GRN', 'HZL', 'GRY', 'AMB')
+_LICENSE_CLASSES = ('C', 'D', 'M', 'CDL')
+_RESTRICTIONS = ('NONE', 'CORRECTIVE LENSES', 'DAYTIME ONLY', '')
+
+# Stores issuing receipts; 'type' selects the item list in _STORE_ITEMS
+_STORE_TYPES = (
+    {'name': 'SuperMart', 'type': 'grocery', 'phone': '(555) 123-4567'},
+    {'name': 'TechWorld', 'type': 'electronics', 'phone': '(555) 234-5678'},
+    {'name': 'Fashion Plus', 'type': 'clothing', 'phone': '(555) 345-6789'},
+    {'name': 'Home Depot', 'type': 'hardware', 'phone': '(555) 456-7890'},
+    {'name': 'BookCorner', 'type': 'bookstore', 'phone': '(555) 567-8901'},
+)
+_PAYMENT_METHODS = ('VISA ****1234', 'CASH', 'MASTERCARD ****5678', 'DEBIT ****9012')
+
+# Letter types and the subject lines used for each
+_LETTER_SUBJECTS = {
+    'business': ('Job Application', 'Meeting Request', 'Project Update', 'Contract Discussion'),
+    'personal': ('Family Update', 'Vacation Plans', 'Birthday Wishes', 'General Catch-up'),
+    'complaint': ('Service Issue', 'Product Problem', 'Billing Error', 'Poor Experience'),
+    'thank_you': ('Interview Thank You', 'Gift Appreciation', 'Help Acknowledgment', 'Service Praise'),
+    'invitation': ('Wedding Invitation', 'Party Invitation', 'Event Invite', 'Dinner Invitation')
+}
+_LETTER_TYPES = tuple(_LETTER_SUBJECTS)
+_SALUTATIONS = ('Dear', 'Hello', 'Hi')
+_CLOSINGS = ('Sincerely', 'Best regards', 'Yours truly', 'Kind regards')
+
+# Book genres and the titles used for each
+_BOOK_TITLES = {
+    'fiction': ('The Silent Garden', 'Midnight Chronicles', 'The Last Journey', 'Whispers in Time'),
+    'non_fiction': ('The Art of Success', 'History Unveiled', 'Science Today', 'Understanding Nature'),
+    'textbook': ('Introduction to Physics', 'Advanced Mathematics', 'Biology Fundamentals', 'Chemistry Principles'),
+    'manual': ('User Manual', 'Operating Instructions', 'Safety Guidelines', 'Technical Specifications'),
+    'cookbook': ('Family Recipes', 'International Cuisine', 'Healthy Cooking', 'Quick Meals')
+}
+_BOOK_GENRES = tuple(_BOOK_TITLES)
+
+# Medical document field choices
+_DIAGNOSES = ('Annual Checkup', 'Cold Symptoms', 'Blood Pressure Check', 'Follow-up Visit')
+_PRESCRIPTIONS = ('Ibuprofen 200mg', 'Amoxicillin 500mg', 'Vitamin D', 'None prescribed')
+_INSURERS = ('BlueCross', 'Aetna', 'Kaiser', 'UnitedHealth')
+
+# Bank statement field choices
+_BANK_NAMES = ('First National Bank', 'Community Trust', 'Metro Bank', 'Valley Credit Union')
+_TRANSACTION_DESCRIPTIONS = ('ATM Withdrawal', 'Online Purchase', 'Direct Deposit', 'Check Payment', 'Transfer')
+_TRANSACTION_TYPES = ('DEPOSIT', 'WITHDRAWAL', 'PURCHASE', 'TRANSFER')
+
+# Report card field choices
+_SUBJECTS = ('Mathematics', 'English', 'Science', 'History', 'Art', 'Physical Education', 'Music')
+_GRADE_LETTERS = ('A', 'A-', 'B+', 'B', 'B-', 'C+', 'C', 'C-')
+_GRADE_COMMENTS = ('Excellent work', 'Good progress', 'Needs improvement', 'Outstanding effort')
+_GRADE_LEVELS = ('3rd Grade', '4th Grade', '5th Grade', '6th Grade', '7th Grade', '8th Grade')
+_SEMESTERS = ('Fall 2024', 'Spring 2024', 'Fall 2023')
+
+
+def _add_years(d, years):
+    """Return the date `years` years after d, moving Feb 29 to Feb 28 in non-leap years."""
+    year = d.year + years
+    if d.month == 2 and d.day == 29 and not calendar.isleap(year):
+        return d.replace(year=year, day=28)
+    return d.replace(year=year)
+
+
+@lru_cache(maxsize=None)
+def _classify_templates(templates):
+    """Map template paths to document types, once per distinct template tuple."""
+    document_types = {}
+    for template in templates:
+        match = _DOCUMENT_TYPE_RE.search(os.path.basename(template))
+        document_types[template] = _DOCUMENT_TYPES[match.group(1)] if match else 'generic'
+    return document_types
 
 
 class OtherGenerator(BaseDocumentGenerator):
     """Generator for diverse document types with template-specific data generation."""
     
+    FAKER_PROVIDERS = (
+        'faker.providers.person',
+        'faker.providers.company',
+        'faker.providers.address',
+        'faker.providers.phone_number',
+        'faker.providers.lorem',
+        'faker.providers.isbn',
+        'faker.providers.internet',
+        'faker.providers.date_time',
+    )
+    
     def __init__(self, config=None):
         super().__init__(config)
         self.template_index = 0
-        self.templates = self._load_templates()
-        self.document_types = self._get_document_types()
+        self._templates = None
+        self._compiled_templates = None
+        self._document_types = None
+        self._generators_by_index = None
+    
+    @property
+    def templates(self):
+        """Template paths, discovered on first use."""
+        if self._templates is None:
+            self._templates = self._load_templates()
+        return self._templates
+    
+    @property
+    def compiled_templates(self):
+        """Template path to compiled template mapping, built on first use."""
+        if self._compiled_templates is None:
+            self._compiled_templates = {path: get_template(path) for path in self.templates}
+        return self._compiled_templates
+    
+    @property
+    def document_types(self):
+        """Template path to document type mapping, built on first use."""
+        if self._document_types is None:
+            self._document_types = self._get_document_types()
+        return self._document_types
+    
+    @property
+    def generators_by_index(self):
+        """Bound generate_<type>_data method for each template, aligned with templates."""
+        if self._generators_by_index is None:
+            self._generators_by_index = [
+                getattr(self, f"generate_{self.document_types[template]}_data") for template in self.templates
+            ]
+        return self._generators_by_index
     
     def _load_templates(self):
         """Load all HTML templates from the templates folder."""
-        templates_dir = os.path.join(os.path.dirname(__file__), 'templates')
-        template_files = glob.glob(os.path.join(templates_dir, '*.html'))
-        if not template_files:
-            raise FileNotFoundError(f"No HTML templates found in {templates_dir}")
-        return sorted(template_files)  # Sort for consistent ordering
+        return discover_templates(_TEMPLATES_DIR)
     
     def _get_document_types(self):
         """Map template filenames to document types for specialized data generation."""
-        document_types = {}
-        for template in self.templates:
-            filename = os.path.basename(template)
-            if 'drivers_license' in filename:
-                document_types[template] = 'drivers_license'
-            elif 'receipt' in filename:
-                document_types[template] = 'receipt'
-            elif 'letter' in filename:
-                document_types[template] = 'letter'
-            elif 'book' in filename:
-                document_types[template] = 'book_page'
-            elif 'invoice' in filename:
-                document_types[template] = 'invoice'
-            elif 'medical' in filename:
-                document_types[template] = 'medical'
-            elif 'bank' in filename:
-                document_types[template] = 'bank_statement'
-            elif 'report' in filename:
-                document_types[template] = 'report_card'
-            else:
-                document_types[template] = 'generic'
-        return document_types
+        return _classify_templates(self.templates)
     
     def get_html_template_path(self):
         """Return the next template path using round-robin selection."""
@@ -59,316 +203,304 @@ class OtherGenerator(BaseDocumentGenerator):
         self.template_index = (self.template_index + 1) % len(self.templates)
         return template_path
     
+    def get_html_template(self):
+        """Return the next precompiled template using round-robin selection."""
+        return self.compiled_templates[self.get_html_template_path()]
+    
+    def seek_template(self, position):
+        """Restart the round-robin so the next template is the one for this position."""
+        self.template_index = position % len(self.templates)
+    
     def generate_fake_data(self):
-        """Generate fake data based on the current template type."""
-        current_template = self.templates[self.template_index - 1]  # -1 because index was incremented
-        doc_type = self.document_types.get(current_template, 'generic')
-        
-        if doc_type == 'drivers_license':
-            return self.generate_drivers_license_data()
-        elif doc_type == 'receipt':
-            return self.generate_receipt_data()
-        elif doc_type == 'letter':
-            return self.generate_letter_data()
-        elif doc_type == 'book_page':
-            return self.generate_book_page_data()
-        elif doc_type == 'invoice':
-            return self.generate_invoice_data()
-        elif doc_type == 'medical':
-            return self.generate_medical_data()
-        elif doc_type == 'bank_statement':
-            return self.generate_bank_statement_data()
-        elif doc_type == 'report_card':
-            return self.generate_report_card_data()
-        else:
-            return self.generate_generic_data()
+        """Generate fake data for the document type of the last selected template."""
+        # template_index already points past the last selected template; when it
+        # has wrapped to 0, index -1 picks the last template as intended
+        return self.generators_by_index[self.template_index - 1]()
     
     def generate_drivers_license_data(self):
         """Generate realistic driver's license data."""
-        states = [
-            {'name': 'California', 'abbr': 'CA', 'format': 'A1234567'},
-            {'name': 'Texas', 'abbr': 'TX', 'format': '12345678'},
-            {'name': 'Florida', 'abbr': 'FL', 'format': 'A123-456-78-901-0'},
-            {'name': 'New York', 'abbr': 'NY', 'format': '123456789'},
-            {'name': 'Pennsylvania', 'abbr': 'PA', 'format': '12 345 678'},
-            {'name': 'Illinois', 'abbr': 'IL', 'format': 'A123-4567-8901'},
-            {'name': 'Ohio', 'abbr': 'OH', 'format': 'AB123456'},
-        ]
+        # Every numeric field and categorical pick on the license in a single draw
+        (state_idx, valid_years, height_ft, height_in, weight,
+         eye_idx, sex_idx, class_idx, restriction_idx, donor_idx) = self.rng.integers(
+            (0, 0, 4, 8, 100, 0, 0, 0, 0, 0),
+            (len(_LICENSE_STATES), 3, 7, 12, 301, len(_EYE_COLORS), 2, len(_LICENSE_CLASSES), len(_RESTRICTIONS), 2)
+        )
         
-        state = random.choice(states)
+        state = _LICENSE_STATES[state_idx]
         birth_date = self.fake.date_of_birth(minimum_age=16, maximum_age=80)
-        issue_date = self.fake.date_between(start_date='-5y', end_date='today')
-        exp_date = issue_date.replace(year=issue_date.year + random.choice([4, 5, 8]))
+        issue_date = self.random_date(-5 * 365)
+        exp_date = _add_years(issue_date, (4, 5, 8)[valid_years])
         
-        # Generate license number based on state format
-        license_format = state['format']
-        license_number = ''
-        for char in license_format:
-            if char.isalpha():
-                license_number += random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
-            elif char.isdigit():
-                license_number += str(random.randint(0, 9))
-            else:
-                license_number += char
+        # Generate license number by filling the state's letter and digit positions
+        template, alpha_idx, digit_idx = _LICENSE_LAYOUTS[state['abbr']]
+        license_chars = template.copy()
+        license_chars[alpha_idx] = self.rng.integers(ord('A'), ord('Z') + 1, size=len(alpha_idx), dtype=np.uint8)
+        license_chars[digit_idx] = self.rng.integers(ord('0'), ord('9') + 1, size=len(digit_idx), dtype=np.uint8)
+        license_number = license_chars.tobytes().decode('ascii')
         
         return {
             'state_name': state['name'],
             'state_abbr': state['abbr'],
             'license_number': license_number,
-            'first_name': self.fake.first_name(),
-            'last_name': self.fake.last_name(),
-            'address': self.fake.street_address(),
-            'city': self.fake.city(),
+            'first_name': self._pooled('first_name'),
+            'last_name': self._pooled('last_name'),
+            'address': self._pooled('street_address'),
+            'city': self._pooled('city'),
             'state': state['abbr'],
-            'zip_code': self.fake.zipcode(),
-            'birth_date': birth_date.strftime('%m/%d/%Y'),
-            'issue_date': issue_date.strftime('%m/%d/%Y'),
-            'exp_date': exp_date.strftime('%m/%d/%Y'),
-            'height': f"{random.randint(4, 6)}'-{random.randint(8, 11)}\"",
-            'weight': random.randint(100, 300),
-            'eye_color': random.choice(['BRN', 'BLU', 'GRN', 'HZL', 'GRY', 'AMB']),
-            'sex': random.choice(['M', 'F']),
-            'class': random.choice(['C', 'D', 'M', 'CDL']),
-            'restrictions': random.choice(['NONE', 'CORRECTIVE LENSES', 'DAYTIME ONLY', '']),
-            'donor': random.choice(['Y', 'N'])
+            'zip_code': self._pooled('zipcode'),
+            'birth_date': format_mmddyyyy(birth_date),
+            'issue_date': format_mmddyyyy(issue_date),
+            'exp_date': format_mmddyyyy(exp_date),
+            'height': f"{height_ft}'-{height_in}\"",
+            'weight': int(weight),
+            'eye_color': _EYE_COLORS[eye_idx],
+            'sex': 'MF'[sex_idx],
+            'class': _LICENSE_CLASSES[class_idx],
+            'restrictions': _RESTRICTIONS[restriction_idx],
+            'donor': 'YN'[donor_idx]
         }
     
     def generate_receipt_data(self):
         """Generate store receipt data."""
-        store_types = [
-            {'name': 'SuperMart', 'type': 'grocery', 'phone': '(555) 123-4567'},
-            {'name': 'TechWorld', 'type': 'electronics', 'phone': '(555) 234-5678'},
-            {'name': 'Fashion Plus', 'type': 'clothing', 'phone': '(555) 345-6789'},
-            {'name': 'Home Depot', 'type': 'hardware', 'phone': '(555) 456-7890'},
-            {'name': 'BookCorner', 'type': 'bookstore', 'phone': '(555) 567-8901'},
-        ]
-        
-        store = random.choice(store_types)
-        items = self.generate_receipt_items(store['type'])
-        
-        subtotal = sum(item['total'] for item in items)
-        tax_rate = random.uniform(0.06, 0.12)
-        tax = subtotal * tax_rate
-        total = subtotal + tax
+        return self.generate_receipts_batch(1)[0]
+    
+    def generate_receipts_batch(self, n):
+        """Generate store receipt data for n receipts, drawing the numeric fields as arrays."""
+        # Store, time, cashier, register, transaction id, payment and day offset per receipt
+        draws = self.rng.integers(
+            (0, 8, 0, 100, 1, 100000, 0, 0),
+            (len(_STORE_TYPES), 23, 60, 1000, 9, 1000000, len(_PAYMENT_METHODS), 31),
+            size=(n, 8)
+        )
+        tax_rates = self.rng.uniform(0.06, 0.12, size=n).tolist()
+        transaction_dates = (np.datetime64(date.today()) - draws[:, 7]).tolist()
         
-        return {
-            'store_name': store['name'],
-            'store_phone': store['phone'],
-            'store_address': self.fake.address().replace('\n', '<br>'),
-            'transaction_date': self.fake.date_between(start_date='-30d', end_date='today').strftime('%m/%d/%Y'),
-            'transaction_time': f"{random.randint(8, 22):02d}:{random.randint(0, 59):02d}",
-            'cashier_id': f"#{random.randint(100, 999)}",
-            'register': random.randint(1, 8),
-            'items': items,
-            'subtotal': f"{subtotal:.2f}",
-            'tax_rate': f"{tax_rate:.1%}",
-            'tax': f"{tax:.2f}",
-            'total': f"{total:.2f}",
-            'payment_method': random.choice(['VISA ****1234', 'CASH', 'MASTERCARD ****5678', 'DEBIT ****9012']),
-            'transaction_id': f"T{random.randint(100000, 999999)}"
-        }
+        receipts = []
+        for (store_idx, hour, minute, cashier_id, register, transaction_id, payment_idx, _), tax_rate, transaction_date in zip(
+            draws.tolist(), tax_rates, transaction_dates
+        ):
+            store = _STORE_TYPES[store_idx]
+            items, item_totals = self.generate_receipt_items(store['type'])
+            
+            subtotal = float(item_totals.sum())
+            tax = subtotal * tax_rate
+            
+            receipts.append({
+                'store_name': store['name'],
+                'store_phone': store['phone'],
+                'store_address': self._html_address(),
+                'transaction_date': format_mmddyyyy(transaction_date),
+                'transaction_time': f"{hour:02d}:{minute:02d}",
+                'cashier_id': f"#{cashier_id}",
+                'register': register,
+                'items': items,
+                'subtotal': subtotal,
+                'tax_rate': f"{tax_rate:.1%}",
+                'tax': tax,
+                'total': subtotal + tax,
+                'payment_method': _PAYMENT_METHODS[payment_idx],
+                'transaction_id': f"T{transaction_id}"
+            })
+        return receipts
     
     def generate_receipt_items(self, store_type):
-        """Generate items specific to store type."""
-        num_items = random.randint(2, 8)
-        items = []
-        
-        item_databases = {
-            'grocery': ['Milk', 'Bread', 'Eggs', 'Bananas', 'Chicken Breast', 'Rice', 'Pasta', 'Cereal', 'Orange Juice'],
-            'electronics': ['USB Cable', 'Phone Case', 'Wireless Mouse', 'Keyboard', 'Headphones', 'Power Bank', 'Screen Protector'],
-            'clothing': ['T-Shirt', 'Jeans', 'Sneakers', 'Jacket', 'Dress', 'Socks', 'Belt', 'Hat'],
-            'hardware': ['Screws', 'Paint', 'Light Bulb', 'Extension Cord', 'Tool Set', 'Garden Hose', 'Door Handle'],
-            'bookstore': ['Novel', 'Magazine', 'Notebook', 'Pen Set', 'Bookmark', 'Calendar', 'Textbook']
-        }
+        """Generate items specific to store type, returning the item rows and their totals array."""
+        num_items = self.rng.integers(2, 9)
+        item_list = _STORE_ITEMS.get(store_type, _STORE_ITEMS['grocery'])
         
-        item_list = item_databases.get(store_type, item_databases['grocery'])
+        # Draw every item's values in one vectorized pass
+        names = self.rng.choice(item_list, size=num_items).tolist()
+        quantities = self.rng.integers(1, 5, size=num_items)
+        prices = np.round(self.rng.uniform(1.99, 89.99, size=num_items), 2)
+        totals = np.round(quantities * prices, 2)
         
-        for _ in range(num_items):
-            item_name = random.choice(item_list)
-            quantity = random.randint(1, 4)
-            price = round(random.uniform(1.99, 89.99), 2)
-            total = round(quantity * price, 2)
-            
-            items.append({
-                'name': item_name,
+        items = [
+            {
+                'name': name,
                 'quantity': quantity,
-                'price': f"{price:.2f}",
+                'price': price,
                 'total': total
-            })
+            }
+            for name, quantity, price, total in zip(names, quantities.tolist(), prices.tolist(), totals.tolist())
+        ]
         
-        return items
+        return items, totals
     
     def generate_letter_data(self):
         """Generate personal letter data."""
-        letter_types = ['business', 'personal', 'complaint', 'thank_you', 'invitation']
-        letter_type = random.choice(letter_types)
-        
-        sender_name = self.fake.name()
-        recipient_name = self.fake.name()
+        letter_type = self.random.choice(_LETTER_TYPES)
         
-        subjects = {
-            'business': ['Job Application', 'Meeting Request', 'Project Update', 'Contract Discussion'],
-            'personal': ['Family Update', 'Vacation Plans', 'Birthday Wishes', 'General Catch-up'],
-            'complaint': ['Service Issue', 'Product Problem', 'Billing Error', 'Poor Experience'],
-            'thank_you': ['Interview Thank You', 'Gift Appreciation', 'Help Acknowledgment', 'Service Praise'],
-            'invitation': ['Wedding Invitation', 'Party Invitation', 'Event Invite', 'Dinner Invitation']
-        }
+        sender_name = self._pooled('name')
+        recipient_name = self._pooled('name')
         
         return {
             'sender_name': sender_name,
-            'sender_address': self.fake.address().replace('\n', '<br>'),
+            'sender_address': self._html_address(),
             'recipient_name': recipient_name,
-            'recipient_address': self.fake.address().replace('\n', '<br>'),
-            'date': self.fake.date_between(start_date='-60d', end_date='today').strftime('%B %d, %Y'),
-            'subject': random.choice(subjects[letter_type]),
-            'salutation': random.choice(['Dear', 'Hello', 'Hi']),
-            'body_paragraph_1': self.fake.paragraph(nb_sentences=4),
-            'body_paragraph_2': self.fake.paragraph(nb_sentences=3),
-            'body_paragraph_3': self.fake.paragraph(nb_sentences=2),
-            'closing': random.choice(['Sincerely', 'Best regards', 'Yours truly', 'Kind regards']),
+            'recipient_address': self._html_address(),
+            'date': self.random_date(-60).strftime('%B %d, %Y'),
+            'subject': self.random.choice(_LETTER_SUBJECTS[letter_type]),
+            'salutation': self.random.choice(_SALUTATIONS),
+            'body_paragraph_1': self._pooled('paragraph', 4),
+            'body_paragraph_2': self._pooled('paragraph', 3),
+            'body_paragraph_3': self._pooled('paragraph', 2),
+            'closing': self.random.choice(_CLOSINGS),
             'letter_type': letter_type
         }
     
     def generate_book_page_data(self):
         """Generate book page content."""
-        book_genres = ['fiction', 'non_fiction', 'textbook', 'manual', 'cookbook']
-        genre = random.choice(book_genres)
-        
-        titles = {
-            'fiction': ['The Silent Garden', 'Midnight Chronicles', 'The Last Journey', 'Whispers in Time'],
-            'non_fiction': ['The Art of Success', 'History Unveiled', 'Science Today', 'Understanding Nature'],
-            'textbook': ['Introduction to Physics', 'Advanced Mathematics', 'Biology Fundamentals', 'Chemistry Principles'],
-            'manual': ['User Manual', 'Operating Instructions', 'Safety Guidelines', 'Technical Specifications'],
-            'cookbook': ['Family Recipes', 'International Cuisine', 'Healthy Cooking', 'Quick Meals']
-        }
+        genre = self.random.choice(_BOOK_GENRES)
         
         return {
-            'book_title': random.choice(titles[genre]),
-            'author': self.fake.name(),
-            'chapter_number': random.randint(1, 25),
-            'chapter_title': self.fake.sentence(nb_words=4).replace('.', ''),
-            'page_number': random.randint(1, 500),
-            'content_paragraph_1': self.fake.paragraph(nb_sentences=6),
-            'content_paragraph_2': self.fake.paragraph(nb_sentences=5),
-            'content_paragraph_3': self.fake.paragraph(nb_sentences=4),
-            'footnote': self.fake.sentence() if random.random() < 0.3 else '',
+            'book_title': self.random.choice(_BOOK_TITLES[genre]),
+            'author': self._pooled('name'),
+            'chapter_number': self.random.randint(1, 25),
+            'chapter_title': self._pooled('sentence', 4).replace('.', ''),
+            'page_number': self.random.randint(1, 500),
+            'content_paragraph_1': self._pooled('paragraph', 6),
+            'content_paragraph_2': self._pooled('paragraph', 5),
+            'content_paragraph_3': self._pooled('paragraph', 4),
+            'footnote': self._pooled('sentence') if self.random.random() < 0.3 else '',
             'genre': genre,
-            'publisher': f"{self.fake.company()} Publishing",
-            'isbn': self.fake.isbn13(),
-            'copyright_year': random.randint(1990, 2024)
+            'publisher': f"{self._pooled('company')} Publishing",
+            'isbn': self._pooled('isbn13'),
+            'copyright_year': self.random.randint(1990, 2024)
         }
     
     def generate_invoice_data(self):
         """Generate business invoice data."""
+        services, service_totals = self.generate_invoice_services()
+        subtotal = float(service_totals.sum())
+        tax = subtotal * self.rng.uniform(0.06, 0.12)
+        
         return {
-            'company_name': self.fake.company(),
-            'company_address': self.fake.address().replace('\n', '<br>'),
-            'company_phone': self.fake.phone_number(),
-            'company_email': self.fake.company_email(),
-            'client_name': self.fake.name(),
-            'client_company': self.fake.company(),
-            'client_address': self.fake.address().replace('\n', '<br>'),
-            'invoice_number': f"INV-{random.randint(1000, 9999)}",
-            'invoice_date': self.fake.date_between(start_date='-30d', end_date='today').strftime('%m/%d/%Y'),
-            'due_date': (self.fake.date_between(start_date='today', end_date='+30d')).strftime('%m/%d/%Y'),
-            'services': self.generate_invoice_services(),
-            'subtotal': '0',  # Will be calculated
-            'tax': '0',       # Will be calculated
-            'total': '0'      # Will be calculated
+            'company_name': self._pooled('company'),
+            'company_address': self._html_address(),
+            'company_phone': self._pooled('phone_number'),
+            'company_email': self._pooled('company_email'),
+            'client_name': self._pooled('name'),
+            'client_company': self._pooled('company'),
+            'client_address': self._html_address(),
+            'invoice_number': f"INV-{self.rng.integers(1000, 10000)}",
+            'invoice_date': format_mmddyyyy(self.random_date(-30)),
+            'due_date': format_mmddyyyy(self.random_date(0, 30)),
+            'services': services,
+            'subtotal': subtotal,
+            'tax': tax,
+            'total': subtotal + tax
         }
     
     def generate_invoice_services(self):
-        """Generate services for invoice."""
-        services = ['Web Development', 'Graphic Design', 'Consulting', 'Content Writing', 'Marketing', 'Photography']
-        num_services = random.randint(1, 4)
-        service_list = []
+        """Generate services for invoice, returning the service rows and their totals array."""
+        num_services = self.rng.integers(1, 5)
         
-        for _ in range(num_services):
-            service = random.choice(services)
-            hours = random.randint(5, 40)
-            rate = round(random.uniform(50, 150), 2)
-            total = hours * rate
-            
-            service_list.append({
+        # Draw every service's values in one vectorized pass
+        names = self.rng.choice(_INVOICE_SERVICES, size=num_services)
+        hours = self.rng.integers(5, 41, size=num_services)
+        rates = np.round(self.rng.uniform(50, 150, size=num_services), 2)
+        totals = hours * rates
+        
+        service_list = [
+            {
                 'description': f"{service} Services",
-                'hours': hours,
-                'rate': f"{rate:.2f}",
-                'total': f"{total:.2f}"
-            })
+                'hours': int(hour_count),
+                'rate': float(rate),
+                'total': float(total)
+            }
+            for service, hour_count, rate, total in zip(names, hours, rates, totals)
+        ]
         
-        return service_list
+        return service_list, totals
     
     def generate_medical_data(self):
         """Generate medical document data."""
         return {
-            'patient_name': self.fake.name(),
-            'patient_dob': self.fake.date_of_birth(minimum_age=1, maximum_age=90).strftime('%m/%d/%Y'),
-            'patient_address': self.fake.address().replace('\n', '<br>'),
-            'doctor_name': f"Dr. {self.fake.name()}",
-            'clinic_name': f"{self.fake.city()} Medical Center",
-            'clinic_address': self.fake.address().replace('\n', '<br>'),
-            'visit_date': self.fake.date_between(start_date='-30d', end_date='today').strftime('%m/%d/%Y'),
-            'diagnosis': random.choice(['Annual Checkup', 'Cold Symptoms', 'Blood Pressure Check', 'Follow-up Visit']),
-            'prescription': random.choice(['Ibuprofen 200mg', 'Amoxicillin 500mg', 'Vitamin D', 'None prescribed']),
-            'next_visit': (self.fake.date_between(start_date='today', end_date='+90d')).strftime('%m/%d/%Y'),
-            'insurance': f"{random.choice(['BlueCross', 'Aetna', 'Kaiser', 'UnitedHealth'])} #{random.randint(100000, 999999)}"
+            'patient_name': self._pooled('name'),
+            'patient_dob': format_mmddyyyy(self.fake.date_of_birth(minimum_age=1, maximum_age=90)),
+            'patient_address': self._html_address(),
+            'doctor_name': f"Dr. {self._pooled('name')}",
+            'clinic_name': f"{self._pooled('city')} Medical Center",
+            'clinic_address': self._html_address(),
+            'visit_date': format_mmddyyyy(self.random_date(-30)),
+            'diagnosis': self.random.choice(_DIAGNOSES),
+            'prescription': self.random.choice(_PRESCRIPTIONS),
+            'next_visit': format_mmddyyyy(self.random_date(0, 90)),
+            'insurance': f"{self.random.choice(_INSURERS)} #{self.random_id(100000, 999999)}"
         }
     
     def generate_bank_statement_data(self):
         """Generate bank statement data."""
+        # Bank, account suffix and the statement period's end offset and span in one draw
+        bank_idx, account_suffix, end_offset, span = self.rng.integers(
+            (0, 1000, 0, 15), (len(_BANK_NAMES), 10000, 31, 45)
+        )
+        period_end = date.today() - timedelta(days=int(end_offset))
+        period_start = period_end - timedelta(days=int(span))
+        beginning_balance, ending_balance = self.rng.uniform((500, 300), (5000, 6000))
+        
         return {
-            'bank_name': random.choice(['First National Bank', 'Community Trust', 'Metro Bank', 'Valley Credit Union']),
-            'account_holder': self.fake.name(),
-            'account_number': f"****{random.randint(1000, 9999)}",
-            'statement_period': f"{self.fake.date_between(start_date='-60d', end_date='-30d').strftime('%m/%d/%Y')} - {self.fake.date_between(start_date='-30d', end_date='today').strftime('%m/%d/%Y')}",
-            'beginning_balance': f"{random.uniform(500, 5000):.2f}",
-            'ending_balance': f"{random.uniform(300, 6000):.2f}",
+            'bank_name': _BANK_NAMES[bank_idx],
+            'account_holder': self._pooled('name'),
+            'account_number': f"****{account_suffix}",
+            'statement_period': f"{format_mmddyyyy(period_start)} - {format_mmddyyyy(period_end)}",
+            'beginning_balance': f"{beginning_balance:.2f}",
+            'ending_balance': f"{ending_balance:.2f}",
             'transactions': self.generate_bank_transactions()
         }
     
     def generate_bank_transactions(self):
         """Generate bank transaction list."""
-        transactions = []
-        for _ in range(random.randint(5, 15)):
-            transaction_types = ['DEPOSIT', 'WITHDRAWAL', 'PURCHASE', 'TRANSFER']
-            transactions.append({
-                'date': self.fake.date_between(start_date='-30d', end_date='today').strftime('%m/%d'),
-                'description': random.choice(['ATM Withdrawal', 'Online Purchase', 'Direct Deposit', 'Check Payment', 'Transfer']),
-                'type': random.choice(transaction_types),
-                'amount': f"{random.uniform(10, 500):.2f}"
-            })
-        return transactions
+        num_transactions = self.rng.integers(5, 16)
+        
+        # Draw each column of the transaction table as one array
+        today = date.today()
+        day_offsets = self.rng.integers(-30, 1, size=num_transactions)
+        description_picks = self.rng.choice(_TRANSACTION_DESCRIPTIONS, size=num_transactions).tolist()
+        type_picks = self.rng.choice(_TRANSACTION_TYPES, size=num_transactions).tolist()
+        amounts = self.rng.uniform(10, 500, size=num_transactions)
+        
+        return [
+            {
+                'date': format_mmdd(today + timedelta(days=int(offset))),
+                'description': description,
+                'type': transaction_type,
+                'amount': f"{amount:.2f}"
+            }
+            for offset, description, transaction_type, amount
+            in zip(day_offsets, description_picks, type_picks, amounts)
+        ]
     
     def generate_report_card_data(self):
         """Generate school report card data."""
-        subjects = ['Mathematics', 'English', 'Science', 'History', 'Art', 'Physical Education', 'Music']
-        grades = []
+        num_subjects, grade_level_idx, semester_idx, attendance = self.rng.integers(
+            (4, 0, 0, 85), (8, len(_GRADE_LEVELS), len(_SEMESTERS), 101)
+        )
+        grade_picks = self.rng.choice(_GRADE_LETTERS, size=num_subjects).tolist()
+        comment_picks = self.rng.choice(_GRADE_COMMENTS, size=num_subjects).tolist()
         
-        for subject in subjects[:random.randint(4, 7)]:
-            grade_letter = random.choice(['A', 'A-', 'B+', 'B', 'B-', 'C+', 'C', 'C-'])
-            grades.append({
-                'subject': subject,
-                'grade': grade_letter,
-                'comments': random.choice(['Excellent work', 'Good progress', 'Needs improvement', 'Outstanding effort'])
-            })
+        grades = [
+            {'subject': subject, 'grade': grade_letter, 'comments': comment}
+            for subject, grade_letter, comment in zip(_SUBJECTS, grade_picks, comment_picks)
+        ]
         
         return {
-            'student_name': self.fake.name(),
-            'grade_level': random.choice(['3rd Grade', '4th Grade', '5th Grade', '6th Grade', '7th Grade', '8th Grade']),
-            'school_name': f"{self.fake.city()} Elementary School",
-            'teacher_name': f"Ms./Mr. {self.fake.last_name()}",
-            'semester': random.choice(['Fall 2024', 'Spring 2024', 'Fall 2023']),
+            'student_name': self._pooled('name'),
+            'grade_level': _GRADE_LEVELS[grade_level_idx],
+            'school_name': f"{self._pooled('city')} Elementary School",
+            'teacher_name': f"Ms./Mr. {self._pooled('last_name')}",
+            'semester': _SEMESTERS[semester_idx],
             'grades': grades,
-            'attendance': f"{random.randint(85, 100)}%",
-            'overall_gpa': f"{random.uniform(2.0, 4.0):.2f}"
+            'attendance': f"{attendance}%",
+            'overall_gpa': f"{self.rng.uniform(2.0, 4.0):.2f}"
         }
     
     def generate_generic_data(self):
         """Generate generic document data."""
         return {
-            'title': self.fake.sentence(nb_words=4).replace('.', ''),
-            'content': self.fake.paragraph(nb_sentences=6),
-            'date': self.fake.date_between(start_date='-30d', end_date='today').strftime('%m/%d/%Y'),
-            'name': self.fake.name(),
-            'company': self.fake.company()
+            'title': self._pooled('sentence', 4).replace('.', ''),
+            'content': self._pooled('paragraph', 6),
+            'date': format_mmddyyyy(self.random_date(-30)),
+            'name': self._pooled('name'),
+            'company': self._pooled('company')
         }
\ No newline at end of file
@@ -3,52 +3,105 @@ Paystub Document Generator
 """
 
 import os
-import glob
-import random
-from datetime import datetime, timedelta
-import sys
+import itertools
+import numpy as np
+from datetime import date, timedelta
 
-from ..base_generator import BaseDocumentGenerator
+from ..base_generator import BaseDocumentGenerator, get_template, discover_templates, format_mmddyyyy
+
+
+# HTML templates for this generator's document types
+_TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), 'templates')
+
+# Deductions that are left blank on the paystub when not taken
+_OPTIONAL_DEDUCTIONS = ('health_insurance', 'retirement')
+
+# Formats an amount with two decimals; bound once so it can be mapped over values
+_format_money = '{:.2f}'.format
+
+
+def _format_amounts(amounts):
+    """Format a dict of paystub amounts as two-decimal strings in one pass."""
+    formatted = dict(zip(amounts, map(_format_money, amounts.values())))
+    for field in _OPTIONAL_DEDUCTIONS:
+        if amounts[field] <= 0:
+            formatted[field] = ""
+    return formatted
+
+
+# Neutral business color schemes as (primary, secondary, accent) colors
+_COLOR_SCHEMES = (
+    ('#2c3e50', '#ecf0f1', '#34495e'),  # Dark blue-gray
+    ('#27ae60', '#ecf0f1', '#2ecc71'),  # Green
+    ('#8e44ad', '#ecf0f1', '#9b59b6'),  # Purple
+    ('#e74c3c', '#ecf0f1', '#c0392b'),  # Red
+    ('#f39c12', '#ecf0f1', '#d68910'),  # Orange
+    ('#17a2b8', '#ecf0f1', '#138496'),  # Teal
+    ('#495057', '#f8f9fa', '#6c757d'),  # Gray
+    ('#6f42c1', '#f8f9fc', '#5a32a3'),  # Indigo
+)
+
+# Pay frequencies and the number of pay periods each has in a year
+_PERIODS_IN_YEAR = {'weekly': 52, 'bi-weekly': 26, 'semi-monthly': 24, 'monthly': 12}
+_PAY_FREQUENCIES = tuple(_PERIODS_IN_YEAR)
+
+# Days from the start to the end of a pay period, per pay frequency
+_PERIOD_DAYS = {'weekly': 6, 'bi-weekly': 13, 'semi-monthly': 14, 'monthly': 29}
+
+# Hours worked per pay frequency as (regular low, regular high, overtime high)
+_HOURS_RANGES = {
+    'weekly': (35, 40, 8),
+    'bi-weekly': (70, 80, 16),
+    'semi-monthly': (75, 85, 12),
+    'monthly': (150, 170, 20),
+}
+
+# The per-frequency tables above as arrays indexed by position in _PAY_FREQUENCIES
+_PERIODS_IN_YEAR_ARRAY = np.array([_PERIODS_IN_YEAR[frequency] for frequency in _PAY_FREQUENCIES])
+_PERIOD_DAYS_ARRAY = np.array([_PERIOD_DAYS[frequency] for frequency in _PAY_FREQUENCIES])
+_HOURS_RANGES_ARRAY = np.array([_HOURS_RANGES[frequency] for frequency in _PAY_FREQUENCIES]).T
 
 
 class PaystubGenerator(BaseDocumentGenerator):
     """Generator for paystub documents with round-robin template selection."""
     
+    FAKER_PROVIDERS = (
+        'faker.providers.person',
+        'faker.providers.company',
+        'faker.providers.address',
+    )
+    
     def __init__(self, config=None):
         super().__init__(config)
-        self.template_index = 0
         self.templates = self._load_templates()
+        self._template_cycle = itertools.cycle(self.templates)
+        self.compiled_templates = {path: get_template(path) for path in self.templates}
     
     def _load_templates(self):
         """Load all HTML templates from the templates folder."""
-        templates_dir = os.path.join(os.path.dirname(__file__), 'templates')
-        template_files = glob.glob(os.path.join(templates_dir, '*.html'))
-        if not template_files:
-            raise FileNotFoundError(f"No HTML templates found in {templates_dir}")
-        return sorted(template_files)  # Sort for consistent ordering
+        return discover_templates(_TEMPLATES_DIR)
     
     def get_html_template_path(self):
         """Return the next template path using round-robin selection."""
-        template_path = self.templates[self.template_index]
-        self.template_index = (self.template_index + 1) % len(self.templates)
-        return template_path
+        return next(self._template_cycle)
+    
+    def get_html_template(self):
+        """Return the next precompiled template using round-robin selection."""
+        return self.compiled_templates[self.get_html_template_path()]
+    
+    def seek_template(self, position):
+        """Restart the round-robin so the next template is the one for this position."""
+        offset = position % len(self.templates)
+        self._template_cycle = itertools.cycle(self.templates[offset:] + self.templates[:offset])
     
     def generate_pay_period(self):
         """Generate a realistic pay period."""
         # Generate a pay period ending recently
-        end_date = self.fake.date_between(start_date='-30d', end_date='today')
+        end_date = self.random_date(-30)
         
         # Determine pay frequency (bi-weekly is most common)
-        pay_frequency = random.choice(['weekly', 'bi-weekly', 'semi-monthly', 'monthly'])
-        
-        if pay_frequency == 'weekly':
-            start_date = end_date - timedelta(days=6)
-        elif pay_frequency == 'bi-weekly':
-            start_date = end_date - timedelta(days=13)
-        elif pay_frequency == 'semi-monthly':
-            start_date = end_date - timedelta(days=14)
-        else:  # monthly
-            start_date = end_date - timedelta(days=29)
+        pay_frequency = self.random.choice(_PAY_FREQUENCIES)
+        start_date = end_date - timedelta(days=_PERIOD_DAYS[pay_frequency])
         
         return start_date, end_date, pay_frequency
     
@@ -60,19 +113,27 @@ class PaystubGenerator(BaseDocumentGenerator):
         return regular_pay, overtime_pay, gross_pay
     
     def generate_realistic_payroll_amounts(self, gross_pay):
-        """Generate realistic but simplified payroll amounts."""
-        # Use simplified percentages for quick calculation
-        federal_tax = gross_pay * random.uniform(0.15, 0.25)
-        state_tax = gross_pay * random.uniform(0.03, 0.08)
-        social_security = gross_pay * 0.062  # Fixed FICA rate
-        medicare = gross_pay * 0.0145  # Fixed Medicare rate
+        """Generate realistic but simplified payroll amounts for a single gross pay."""
+        amounts = self.generate_realistic_payroll_amounts_batch([gross_pay])
+        return {field: float(values[0]) for field, values in amounts.items()}
+    
+    def generate_realistic_payroll_amounts_batch(self, gross_pays):
+        """Generate realistic but simplified payroll amounts for an array of gross pays."""
+        gross_pays = np.asarray(gross_pays, dtype=np.float64)
+        n = len(gross_pays)
         
-        # Optional deductions with simple faker-style generation
-        health_insurance = random.uniform(50, 300) if random.random() > 0.3 else 0
-        retirement = gross_pay * random.uniform(0.03, 0.08) if random.random() > 0.4 else 0
+        federal_tax = gross_pays * self.rng.uniform(0.15, 0.25, size=n)
+        state_tax = gross_pays * self.rng.uniform(0.03, 0.08, size=n)
+        social_security = gross_pays * 0.062  # Fixed FICA rate
+        medicare = gross_pays * 0.0145  # Fixed Medicare rate
+        
+        # Optional deductions, zeroed where the paystub does not carry them
+        has_health_insurance, has_retirement = self.rng.random((2, n)) > np.array([[0.3], [0.4]])
+        health_insurance = np.where(has_health_insurance, self.rng.uniform(50, 300, size=n), 0.0)
+        retirement = gross_pays * np.where(has_retirement, self.rng.uniform(0.03, 0.08, size=n), 0.0)
         
         total_deductions = federal_tax + state_tax + social_security + medicare + health_insurance + retirement
-        net_pay = gross_pay - total_deductions
+        net_pay = gross_pays - total_deductions
         
         return {
             'federal_tax': federal_tax,
@@ -87,103 +148,99 @@ class PaystubGenerator(BaseDocumentGenerator):
     
     def generate_color_scheme(self):
         """Generate a random color scheme to avoid color-based bias."""
-        # Generate neutral business color schemes
-        schemes = [
-            {'primary': '#2c3e50', 'secondary': '#ecf0f1', 'accent': '#34495e'},  # Dark blue-gray
-            {'primary': '#27ae60', 'secondary': '#ecf0f1', 'accent': '#2ecc71'},  # Green
-            {'primary': '#8e44ad', 'secondary': '#ecf0f1', 'accent': '#9b59b6'},  # Purple  
-            {'primary': '#e74c3c', 'secondary': '#ecf0f1', 'accent': '#c0392b'},  # Red
-            {'primary': '#f39c12', 'secondary': '#ecf0f1', 'accent': '#d68910'},  # Orange
-            {'primary': '#17a2b8', 'secondary': '#ecf0f1', 'accent': '#138496'},  # Teal
-            {'primary': '#495057', 'secondary': '#f8f9fa', 'accent': '#6c757d'},  # Gray
-            {'primary': '#6f42c1', 'secondary': '#f8f9fc', 'accent': '#5a32a3'},  # Indigo
-        ]
-        return random.choice(schemes)
+        return self.random.choice(_COLOR_SCHEMES)
     
     def generate_ytd_amounts(self, payroll_amounts, periods_elapsed):
-        """Generate year-to-date amounts with realistic variance."""
-        variance = random.uniform(0.85, 1.15)  # Add some realistic variance
+        """Generate year-to-date amounts with realistic variance for a single paystub."""
+        amounts = self.generate_ytd_amounts_batch(payroll_amounts, [periods_elapsed])
+        return {field: float(values[0]) for field, values in amounts.items()}
+    
+    def generate_ytd_amounts_batch(self, payroll_amounts, periods_elapsed):
+        """Generate year-to-date amounts with realistic variance from arrays of payroll amounts."""
+        periods_elapsed = np.asarray(periods_elapsed, dtype=np.float64)
+        scale = periods_elapsed * self.rng.uniform(0.85, 1.15, size=len(periods_elapsed))
         return {
-            'ytd_gross': payroll_amounts['gross_pay'] * periods_elapsed * variance,
-            'ytd_federal_tax': payroll_amounts['federal_tax'] * periods_elapsed * variance,
-            'ytd_net': payroll_amounts['net_pay'] * periods_elapsed * variance
+            'ytd_gross': payroll_amounts['gross_pay'] * scale,
+            'ytd_federal_tax': payroll_amounts['federal_tax'] * scale,
+            'ytd_net': payroll_amounts['net_pay'] * scale
         }
     
-    def generate_fake_data(self):
-        """Generate fake data for paystub."""
-        # Generate color scheme to avoid color bias
-        colors = self.generate_color_scheme()
-        
-        # Employee information
-        employee_name = self.fake.name()
-        employee_id = random.randint(1000, 9999)
-        
-        # Company information
-        company_name = self.fake.company()
-        company_address = self.fake.address().replace('\n', '<br>')
-        
-        # Pay period information
-        start_date, end_date, pay_frequency = self.generate_pay_period()
-        
-        # Pay information
-        hourly_rate = random.uniform(15, 45)
-        
-        # Calculate hours based on pay frequency
-        if pay_frequency == 'weekly':
-            regular_hours = random.uniform(35, 40)
-            overtime_hours = random.uniform(0, 8)
-        elif pay_frequency == 'bi-weekly':
-            regular_hours = random.uniform(70, 80)
-            overtime_hours = random.uniform(0, 16)
-        elif pay_frequency == 'semi-monthly':
-            regular_hours = random.uniform(75, 85)
-            overtime_hours = random.uniform(0, 12)
-        else:  # monthly
-            regular_hours = random.uniform(150, 170)
-            overtime_hours = random.uniform(0, 20)
-        
-        # Generate pay amounts
-        regular_pay, overtime_pay, gross_pay = self.generate_pay_amounts(hourly_rate, regular_hours, overtime_hours)
+    def _draw_batch_randoms(self, n):
+        """Draw the random inputs for n paystubs, one array per field."""
+        frequency_idx = self.rng.integers(len(_PAY_FREQUENCIES), size=n)
+        regular_low, regular_high, overtime_high = _HOURS_RANGES_ARRAY[:, frequency_idx]
+        end_offset, pay_date_offset, employee_id, check_number, scheme_idx = self.rng.integers(
+            (0, 1, 1000, 10000, 0), (31, 8, 10000, 100000, len(_COLOR_SCHEMES)), size=(n, 5)
+        ).T
+        return {
+            'frequency_idx': frequency_idx,
+            'end_offset': end_offset,
+            'pay_date_offset': pay_date_offset,
+            'employee_id': employee_id,
+            'check_number': check_number,
+            'scheme_idx': scheme_idx,
+            'hourly_rate': self.rng.uniform(15, 45, size=n),
+            'regular_hours': self.rng.uniform(regular_low, regular_high),
+            'overtime_hours': self.rng.uniform(0, overtime_high),
+            'periods_elapsed': self.rng.integers(1, _PERIODS_IN_YEAR_ARRAY[frequency_idx] + 1),
+        }
+    
+    def generate_fake_data_batch(self, n):
+        """Generate fake data for n paystubs, running the payroll math on arrays."""
+        draws = self._draw_batch_randoms(n)
+        hourly_rate = draws['hourly_rate']
+        frequency_idx = draws['frequency_idx']
         
-        # Calculate realistic deductions using base class
-        payroll_amounts = self.generate_realistic_payroll_amounts(gross_pay)
+        # Pay, deduction and year-to-date amounts for the whole batch
+        regular_pay, overtime_pay, gross_pay = self.generate_pay_amounts(
+            hourly_rate, draws['regular_hours'], draws['overtime_hours']
+        )
+        payroll_amounts = self.generate_realistic_payroll_amounts_batch(gross_pay)
         payroll_amounts['gross_pay'] = gross_pay
+        ytd_amounts = self.generate_ytd_amounts_batch(payroll_amounts, draws['periods_elapsed'])
+        amount_columns = {
+            'hourly_rate': hourly_rate,
+            'regular_pay': regular_pay,
+            'overtime_rate': hourly_rate * 1.5,
+            'overtime_pay': overtime_pay,
+            **payroll_amounts,
+            **ytd_amounts
+        }
+        amount_rows = zip(*(column.tolist() for column in amount_columns.values()))
         
-        # Year-to-date calculations
-        periods_in_year = {'weekly': 52, 'bi-weekly': 26, 'semi-monthly': 24, 'monthly': 12}
-        periods_elapsed = random.randint(1, periods_in_year[pay_frequency])
-        ytd_amounts = self.generate_ytd_amounts(payroll_amounts, periods_elapsed)
+        # Pay period dates as datetime64 arithmetic, converted back to dates
+        end_dates = np.datetime64(date.today()) - draws['end_offset']
+        start_dates = end_dates - _PERIOD_DAYS_ARRAY[frequency_idx]
+        pay_dates = end_dates + draws['pay_date_offset']
         
-        return {
-            'company_name': company_name,
-            'company_address': company_address,
-            'employee_name': employee_name,
-            'employee_id': employee_id,
-            'pay_period_start': start_date.strftime('%m/%d/%Y'),
-            'pay_period_end': end_date.strftime('%m/%d/%Y'),
-            'pay_date': (end_date + timedelta(days=random.randint(1, 7))).strftime('%m/%d/%Y'),
-            'pay_frequency': pay_frequency.title(),
-            'hourly_rate': f"{hourly_rate:.2f}",
-            'regular_hours': f"{regular_hours:.1f}",
-            'regular_pay': f"{regular_pay:.2f}",
-            'overtime_hours': f"{overtime_hours:.1f}",
-            'overtime_rate': f"{hourly_rate * 1.5:.2f}",
-            'overtime_pay': f"{overtime_pay:.2f}",
-            'gross_pay': f"{gross_pay:.2f}",
-            'federal_tax': f"{payroll_amounts['federal_tax']:.2f}",
-            'state_tax': f"{payroll_amounts['state_tax']:.2f}",
-            'social_security': f"{payroll_amounts['social_security']:.2f}",
-            'medicare': f"{payroll_amounts['medicare']:.2f}",
-            'health_insurance': f"{payroll_amounts['health_insurance']:.2f}" if payroll_amounts['health_insurance'] > 0 else "",
-            'retirement': f"{payroll_amounts['retirement']:.2f}" if payroll_amounts['retirement'] > 0 else "",
-            'total_deductions': f"{payroll_amounts['total_deductions']:.2f}",
-            'net_pay': f"{payroll_amounts['net_pay']:.2f}",
-            'ytd_gross': f"{ytd_amounts['ytd_gross']:.2f}",
-            'ytd_net': f"{ytd_amounts['ytd_net']:.2f}",
-            'ytd_federal_tax': f"{ytd_amounts['ytd_federal_tax']:.2f}",
-            'check_number': random.randint(10000, 99999),
-            # Add dynamic colors to prevent color-based bias
-            'primary_color': colors['primary'],
-            'secondary_color': colors['secondary'],
-            'accent_color': colors['accent']
-        }
\ No newline at end of file
+        return [
+            {
+                **_format_amounts(dict(zip(amount_columns, amounts))),
+                'company_name': self._pooled('company'),
+                'company_address': self._html_address(),
+                'employee_name': self._pooled('name'),
+                'employee_id': employee_id,
+                'pay_period_start': format_mmddyyyy(start_date),
+                'pay_period_end': format_mmddyyyy(end_date),
+                'pay_date': format_mmddyyyy(pay_date),
+                'pay_frequency': _PAY_FREQUENCIES[frequency].title(),
+                'regular_hours': f"{regular_hours:.1f}",
+                'overtime_hours': f"{overtime_hours:.1f}",
+                'check_number': check_number,
+                # Add dynamic colors to prevent color-based bias
+                'primary_color': primary_color,
+                'secondary_color': secondary_color,
+                'accent_color': accent_color
+            }
+            for (amounts, frequency, start_date, end_date, pay_date, regular_hours, overtime_hours,
+                 employee_id, check_number, (primary_color, secondary_color, accent_color)) in zip(
+                amount_rows, frequency_idx.tolist(), start_dates.tolist(), end_dates.tolist(),
+                pay_dates.tolist(), draws['regular_hours'].tolist(), draws['overtime_hours'].tolist(),
+                draws['employee_id'].tolist(), draws['check_number'].tolist(),
+                [_COLOR_SCHEMES[idx] for idx in draws['scheme_idx'].tolist()]
+            )
+        ]
+    
+    def generate_fake_data(self):
+        """Generate fake data for a single paystub; batch workers use generate_fake_data_batch."""
+        return self.generate_fake_data_batch(1)[0]
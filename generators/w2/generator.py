@@ -3,87 +3,132 @@ W-2 Tax Form Document Generator
 """
 
 import os
-import glob
-import random
+import itertools
+import numpy as np
 from datetime import datetime
-import sys
 
-from ..base_generator import BaseDocumentGenerator
+from ..base_generator import BaseDocumentGenerator, get_template, discover_templates
+
+
+# HTML templates for this generator's document types
+_TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), 'templates')
+
+# Numeric W-2 boxes in the order generate_fake_data_batch unpacks each form's row
+_NUMERIC_BOXES = (
+    'wages',
+    'federal_withholding',
+    'state_withholding',
+    'social_security_wages',
+    'social_security_tax',
+    'medicare_tax',
+    'local_tax',
+    'dependent_care_benefits',
+    'nonqualified_plans',
+)
 
 
 class W2Generator(BaseDocumentGenerator):
     """Generator for W-2 tax forms with round-robin template selection."""
     
+    FAKER_PROVIDERS = (
+        'faker.providers.person',
+        'faker.providers.company',
+        'faker.providers.address',
+        'faker.providers.ssn',
+    )
+    
     def __init__(self, config=None):
         super().__init__(config)
-        self.template_index = 0
         self.templates = self._load_templates()
+        self._template_cycle = itertools.cycle(self.templates)
+        self.compiled_templates = {path: get_template(path) for path in self.templates}
     
     def _load_templates(self):
         """Load all HTML templates from the templates folder."""
-        templates_dir = os.path.join(os.path.dirname(__file__), 'templates')
-        template_files = glob.glob(os.path.join(templates_dir, '*.html'))
-        if not template_files:
-            raise FileNotFoundError(f"No HTML templates found in {templates_dir}")
-        return sorted(template_files)  # Sort for consistent ordering
+        return discover_templates(_TEMPLATES_DIR)
     
     def get_html_template_path(self):
         """Return the next template path using round-robin selection."""
-        template_path = self.templates[self.template_index]
-        self.template_index = (self.template_index + 1) % len(self.templates)
-        return template_path
+        return next(self._template_cycle)
     
-    def generate_fake_data(self):
-        """Generate fake data for W-2 form."""
-        # Generate realistic wage amounts
-        annual_wages = random.randint(30000, 150000)
-        federal_tax_rate = random.uniform(0.18, 0.28)
-        state_tax_rate = random.uniform(0.03, 0.08)
-        
-        federal_withholding = annual_wages * federal_tax_rate
-        state_withholding = annual_wages * state_tax_rate
-        social_security_wages = min(annual_wages, 160200)  # 2023 SS wage base
-        social_security_tax = social_security_wages * 0.062
-        medicare_tax = annual_wages * 0.0145
-        
-        # Generate employer info
-        employer_name = self.fake.company()
-        employer_address = self.fake.address().replace('\n', '<br>')
-        
-        # Generate employee info
-        employee_first_name = self.fake.first_name()
-        employee_last_name = self.fake.last_name()
-        employee_address = self.fake.address().replace('\n', '<br>')
+    def get_html_template(self):
+        """Return the next precompiled template using round-robin selection."""
+        return self.compiled_templates[self.get_html_template_path()]
+    
+    def seek_template(self, position):
+        """Restart the round-robin so the next template is the one for this position."""
+        offset = position % len(self.templates)
+        self._template_cycle = itertools.cycle(self.templates[offset:] + self.templates[:offset])
+    
+    def generate_numeric_batch(self, n):
+        """Draw the wage and withholding amounts for n W-2 forms, one array per box."""
+        wages = self.rng.integers(30000, 150001, size=n)
+        federal_tax_rate, state_tax_rate, local_tax_rate = self.rng.uniform(
+            (0.18, 0.03, 0.01), (0.28, 0.08, 0.03), size=(n, 3)
+        ).T
+        social_security_wages = np.minimum(wages, 160200)  # 2023 SS wage base
+        return {
+            'wages': wages,
+            'federal_withholding': wages * federal_tax_rate,
+            'state_withholding': wages * state_tax_rate,
+            'social_security_wages': social_security_wages,
+            'social_security_tax': social_security_wages * 0.062,
+            'medicare_tax': wages * 0.0145,
+            'local_tax': wages * local_tax_rate,
+            'dependent_care_benefits': self.rng.integers(0, 5001, size=n),
+            'nonqualified_plans': self.rng.integers(0, 10001, size=n),
+        }
+    
+    def generate_fake_data_batch(self, n):
+        """Generate fake data for n W-2 forms, computing the numeric boxes as arrays."""
+        numeric = self.generate_numeric_batch(n)
+        # Decide which optional boxes are filled on every form in a single draw
+        optional_boxes = (self.rng.random((n, 5)) > (0.7, 0.8, 0.5, 0.5, 0.5)).tolist()
+        # Random tax years from the modern era (2000-current year)
+        tax_years = self.rng.integers(2000, datetime.now().year + 1, size=n).tolist()
+        random_id = self.random_id
         
-        # Generate random tax year from modern era (2000-current year)
-        current_year = datetime.now().year
-        tax_year = random.randint(2000, current_year)
+        # Unpack each form's numeric boxes positionally instead of looking each
+        # one up by name per form
+        rows = zip(zip(*(numeric[box].tolist() for box in _NUMERIC_BOXES)), optional_boxes, tax_years)
         
-        return {
-            'tax_year': tax_year,
-            'employee_ssn': self.fake.ssn(),
-            'employee_first_name': employee_first_name,
-            'employee_last_name': employee_last_name,
-            'employee_address': employee_address,
-            'employer_ein': f"{random.randint(10,99)}-{random.randint(1000000,9999999)}",
-            'employer_name': employer_name,
-            'employer_address': employer_address,
-            'employer_state_id': f"{random.randint(100000,999999)}",
-            'control_number': f"{random.randint(10000,99999)}",
-            'wages': f"{annual_wages:,.2f}",
-            'federal_tax_withheld': f"{federal_withholding:,.2f}",
-            'social_security_wages': f"{social_security_wages:,.2f}",
-            'social_security_tax': f"{social_security_tax:,.2f}",
-            'medicare_wages': f"{annual_wages:,.2f}",
-            'medicare_tax': f"{medicare_tax:,.2f}",
-            'social_security_tips': "0.00",
-            'allocated_tips': "0.00",
-            'dependent_care_benefits': f"{random.randint(0, 5000):,.2f}" if random.random() > 0.7 else "0.00",
-            'nonqualified_plans': f"{random.randint(0, 10000):,.2f}" if random.random() > 0.8 else "0.00",
-            'state_wages': f"{annual_wages:,.2f}",
-            'state_tax_withheld': f"{state_withholding:,.2f}",
-            'state': self.fake.state_abbr(),
-            'local_wages': f"{annual_wages:,.2f}" if random.random() > 0.5 else "",
-            'local_tax': f"{annual_wages * random.uniform(0.01, 0.03):,.2f}" if random.random() > 0.5 else "",
-            'locality_name': self.fake.city() if random.random() > 0.5 else ""
-        }
\ No newline at end of file
+        forms = []
+        for ((annual_wages, federal_withholding, state_withholding, social_security_wages,
+              social_security_tax, medicare_tax, local_tax, dependent_care_benefits, nonqualified_plans),
+             (has_dependent_care, has_nonqualified_plans, has_local_wages, has_local_tax, has_locality),
+             tax_year) in rows:
+            # Boxes 1, 5, 16 and 18 all report the same wages, so format them once
+            wages = f"{annual_wages:,.2f}"
+            forms.append({
+                'tax_year': tax_year,
+                'employee_ssn': self._pooled('ssn'),
+                'employee_first_name': self._pooled('first_name'),
+                'employee_last_name': self._pooled('last_name'),
+                'employee_address': self._html_address(),
+                'employer_ein': f"{random_id(10, 99)}-{random_id(1000000, 9999999)}",
+                'employer_name': self._pooled('company'),
+                'employer_address': self._html_address(),
+                'employer_state_id': f"{random_id(100000, 999999)}",
+                'control_number': f"{random_id(10000, 99999)}",
+                'wages': wages,
+                'federal_tax_withheld': f"{federal_withholding:,.2f}",
+                'social_security_wages': f"{social_security_wages:,.2f}",
+                'social_security_tax': f"{social_security_tax:,.2f}",
+                'medicare_wages': wages,
+                'medicare_tax': f"{medicare_tax:,.2f}",
+                'social_security_tips': "0.00",
+                'allocated_tips': "0.00",
+                'dependent_care_benefits': f"{dependent_care_benefits:,.2f}" if has_dependent_care else "0.00",
+                'nonqualified_plans': f"{nonqualified_plans:,.2f}" if has_nonqualified_plans else "0.00",
+                'state_wages': wages,
+                'state_tax_withheld': f"{state_withholding:,.2f}",
+                'state': self._pooled('state_abbr'),
+                'local_wages': wages if has_local_wages else "",
+                'local_tax': f"{local_tax:,.2f}" if has_local_tax else "",
+                'locality_name': self._pooled('city') if has_locality else ""
+            })
+        return forms
+    
+    def generate_fake_data(self):
+        """Generate fake data for a single W-2 form; batch workers use generate_fake_data_batch."""
+        return self.generate_fake_data_batch(1)[0]
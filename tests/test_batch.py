@@ -0,0 +1,56 @@
+"""
+Tests for parallel batch generation.
+"""
+
+import hashlib
+import os
+
+import numpy as np
+import pytest
+
+try:
+    from generators import BaseDocumentGenerator, W2Generator, PaystubGenerator, OtherGenerator
+    from generators.base_generator import _BATCH_MP_CONTEXT
+except (ImportError, OSError) as e:
+    # WeasyPrint raises OSError when its system libraries are missing
+    pytest.skip(f"generators cannot be imported: {e}", allow_module_level=True)
+
+from config import Config
+
+
+GENERATOR_CLASSES = [W2Generator, PaystubGenerator, OtherGenerator]
+
+
+def _data_image(self, template, data, width=850, height=1100):
+    """Stand-in renderer whose pixels are a digest of the template and data."""
+    digest = hashlib.sha256(repr((template.name, sorted(data.items()))).encode()).digest()
+    return np.frombuffer(digest, dtype=np.uint8).reshape(1, -1, 1).repeat(3, axis=2).copy()
+
+
+def _batch_digests(generator_cls, output_dir, config):
+    """Run a 2-worker batch and return each file's name and contents."""
+    filepaths = generator_cls.generate_batch(24, str(output_dir), config, max_workers=2)
+    assert len(filepaths) == 24
+    contents = {}
+    for filepath in filepaths:
+        with open(filepath, 'rb') as f:
+            contents[os.path.basename(filepath)] = f.read()
+    return contents
+
+
+@pytest.mark.skipif(_BATCH_MP_CONTEXT is None, reason="stand-in renderer reaches workers only by fork")
+@pytest.mark.parametrize("generator_cls", GENERATOR_CLASSES, ids=lambda cls: cls.__name__)
+def test_seeded_batch_data_is_reproducible(generator_cls, tmp_path, monkeypatch):
+    # Compare the fake data rather than real images: Augraphy's Folding is
+    # nondeterministic even when seeded
+    monkeypatch.setattr(BaseDocumentGenerator, 'render_html_to_image', _data_image)
+    monkeypatch.setattr(BaseDocumentGenerator, 'apply_augmentation', lambda self, image: image)
+    config = Config()
+    config.RANDOM_SEED = 1234
+    config.IMAGE_FORMAT = "png"
+    config.BATCH_CHUNK_SIZE = 3  # Many small chunks so workers take them in varying order
+    
+    first = _batch_digests(generator_cls, tmp_path / "first", config)
+    second = _batch_digests(generator_cls, tmp_path / "second", config)
+    assert first == second
+    assert len(set(first.values())) == len(first)
@@ -0,0 +1,55 @@
+"""
+Distribution checks for the Faker data the generators draw from.
+
+The generated documents are training data, so Faker's weighted format tables
+must keep their weights: sampling them uniformly turns rare formats such as
+military addresses or titled names into the majority.
+"""
+
+import re
+
+import pytest
+
+try:
+    from generators import BaseDocumentGenerator, W2Generator, PaystubGenerator, OtherGenerator
+except (ImportError, OSError) as e:
+    # WeasyPrint raises OSError when its system libraries are missing
+    pytest.skip(f"generators cannot be imported: {e}", allow_module_level=True)
+
+
+SAMPLES = 2000
+
+# Weighted, about 11% of en_US addresses are military and 4% of names carry a
+# prefix or suffix; uniformly sampled, both are over 70%
+MILITARY_ADDRESS = re.compile(r'\b(APO|FPO|DPO)\b')
+NAME_AFFIX = re.compile(r'^(Dr|Mr|Mrs|Ms|Miss)\. |\b(DDS|DVM|MD|PhD|Jr\.|II|III|IV|V)$')
+
+GENERATOR_CLASSES = [W2Generator, PaystubGenerator, OtherGenerator]
+
+
+def _share(values, pattern):
+    """Return the fraction of values matching a regex."""
+    return sum(1 for value in values if pattern.search(value)) / len(values)
+
+
+@pytest.fixture(params=GENERATOR_CLASSES, ids=lambda cls: cls.__name__)
+def fake(request):
+    """The shared Faker instance a generator class uses, seeded for the test."""
+    faker = BaseDocumentGenerator._get_faker(request.param.FAKER_PROVIDERS)
+    faker.seed_instance(0)
+    return faker
+
+
+def test_military_address_share(fake):
+    addresses = [fake.address() for _ in range(SAMPLES)]
+    assert _share(addresses, MILITARY_ADDRESS) < 0.2
+
+
+def test_html_address_military_share(fake):
+    addresses = [fake.html_address() for _ in range(SAMPLES)]
+    assert _share(addresses, MILITARY_ADDRESS) < 0.2
+
+
+def test_name_affix_share(fake):
+    names = [fake.name() for _ in range(SAMPLES)]
+    assert _share(names, NAME_AFFIX) < 0.1
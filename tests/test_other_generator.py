@@ -0,0 +1,26 @@
+"""
+Tests for the other-document generator's helpers.
+"""
+
+from datetime import date
+
+import pytest
+
+try:
+    from generators.other.generator import _add_years
+except (ImportError, OSError) as e:
+    # WeasyPrint raises OSError when its system libraries are missing
+    pytest.skip(f"generators cannot be imported: {e}", allow_module_level=True)
+
+
+def test_add_years_from_leap_day_to_common_year():
+    # A Feb 29 issue date with a 5 year expiry used to raise ValueError
+    assert _add_years(date(2024, 2, 29), 5) == date(2029, 2, 28)
+
+
+def test_add_years_from_leap_day_to_leap_year():
+    assert _add_years(date(2024, 2, 29), 4) == date(2028, 2, 29)
+
+
+def test_add_years_ordinary_date():
+    assert _add_years(date(2023, 7, 14), 8) == date(2031, 7, 14)
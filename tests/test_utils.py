@@ -0,0 +1,53 @@
+"""
+Tests for the drawing and layout helpers in utils.
+"""
+
+import random
+
+import cv2
+import pytest
+
+from utils import wrap_text
+
+
+WORDS = (
+    "a I an of to in is it on be we at by or as"
+    " pay tax form wage date name total amount social security medicare"
+    " withholding employer employee federal statement period deductions"
+    " Mississippi Massachusetts W-2 1099-MISC $1,234.56 12/31/2023 WWW mmm iii"
+).split()
+
+
+def _measured_wrap(text, max_width, font_scale):
+    """Wrap text by measuring every candidate line whole, the reference line breaks."""
+    lines = []
+    current_line = ""
+    for word in text.split():
+        test_line = current_line + (" " if current_line else "") + word
+        (text_width, _), _ = cv2.getTextSize(test_line, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 1)
+        if text_width <= max_width:
+            current_line = test_line
+        else:
+            if current_line:
+                lines.append(current_line)
+            current_line = word
+    if current_line:
+        lines.append(current_line)
+    return lines
+
+
+@pytest.mark.parametrize("font_scale", [0.4, 0.5, 0.6, 0.8, 1.0])
+def test_wrap_text_matches_whole_line_measurement(font_scale):
+    rng = random.Random(font_scale)
+    for _ in range(600):
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 40)))
+        max_width = rng.randint(40, 700)
+        assert wrap_text(text, max_width, font_scale) == _measured_wrap(text, max_width, font_scale), (text, max_width)
+
+
+def test_wrap_text_keeps_overlong_word_on_its_own_line():
+    assert wrap_text("to Massachusetts to", 30, 0.6) == ["to", "Massachusetts", "to"]
+
+
+def test_wrap_text_empty():
+    assert wrap_text("   ", 100) == []